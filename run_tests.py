@@ -1,15 +1,22 @@
-import unittest
+import os
 import sys
+import time
+import unittest
+
+WATCH_DIRS = ('src', 'tests')
+# Project modules dropped before each re-run so discovery imports them afresh
+PROJECT_MODULES = ('src', 'translate')
+WATCH_INTERVAL = 1.0
 
 def run_tests():
     """Discovers and runs all tests in the 'tests' directory."""
     # Add the 'tests' directory to the Python path to allow discovery
     loader = unittest.TestLoader()
     suite = loader.discover('tests')
-    
+
     runner = unittest.TextTestRunner()
     result = runner.run(suite)
-    
+
     if result.wasSuccessful():
         print("\n✅ All tests passed successfully!")
         sys.exit(0)
@@ -17,5 +24,50 @@ def run_tests():
         print("\n❌ Some tests failed.")
         sys.exit(1)
 
+def _snapshot(directories):
+    """Map every Python source file under the given directories, and at the top level, to its mtime."""
+    mtimes = {}
+    with os.scandir('.') as entries:
+        for entry in entries:
+            if entry.is_file() and entry.name.endswith('.py'):
+                mtimes[entry.path] = entry.stat().st_mtime_ns
+    pending = list(directories)
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                elif entry.name.endswith('.py'):
+                    mtimes[entry.path] = entry.stat().st_mtime_ns
+    return mtimes
+
+def _forget_project_modules():
+    """Drop project and test modules from sys.modules so the next discovery re-imports them."""
+    for name in list(sys.modules):
+        if name.split('.')[0] in PROJECT_MODULES or name.startswith('test_'):
+            del sys.modules[name]
+
+def watch_tests():
+    """Re-run the suite whenever a source file changes, keeping third-party imports warm."""
+    loader = unittest.TestLoader()
+    runner = unittest.TextTestRunner()
+    snapshot = _snapshot(WATCH_DIRS)
+
+    try:
+        while True:
+            runner.run(loader.discover('tests'))
+            print("\n👀 Watching for changes (Ctrl+C to stop)...")
+
+            while (current := _snapshot(WATCH_DIRS)) == snapshot:
+                time.sleep(WATCH_INTERVAL)
+
+            snapshot = current
+            _forget_project_modules()
+    except KeyboardInterrupt:
+        sys.exit(0)
+
 if __name__ == '__main__':
-    run_tests()
\ No newline at end of file
+    if '--watch' in sys.argv[1:]:
+        watch_tests()
+    else:
+        run_tests()
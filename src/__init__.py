@@ -1,8 +1,36 @@
 """Translation workflow package"""
 
+from typing import Optional
+
 from .config import Config
 from .translator import Translator
 from .file_processor import FileProcessor
 from .git_operations import GitOperations
 
-__all__ = ['Config', 'Translator', 'FileProcessor', 'GitOperations']
+_file_processor: Optional[FileProcessor] = None
+
+
+def get_config() -> Config:
+    """Return the shared configuration (built from the environment once)"""
+    return Config.get()
+
+
+def get_file_processor() -> FileProcessor:
+    """Return the shared FileProcessor bound to the shared configuration"""
+    global _file_processor
+    if _file_processor is None:
+        _file_processor = FileProcessor(get_config())
+    return _file_processor
+
+
+def reset_for_tests() -> None:
+    """Drop the shared instances so the next getter call rebuilds them"""
+    global _file_processor
+    _file_processor = None
+    Config.reset()
+
+
+__all__ = [
+    'Config', 'Translator', 'FileProcessor', 'GitOperations',
+    'get_config', 'get_file_processor',
+]
@@ -1,41 +1,99 @@
 #!/usr/bin/env python3
 
 import os
+import stat
 import sys
-from dataclasses import dataclass, field
-from pathlib import Path
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional
 
 
-@dataclass
+_CONFIG_SINGLETON: Optional['Config'] = None
+
+
+@lru_cache(maxsize=None)
+def _read_prompt_file(path: str, mtime_ns: int) -> str:
+    """Read a prompt file, cached per path and modification time"""
+    with open(path, 'rb') as f:
+        return f.read().decode('utf-8')
+
+
+@dataclass(frozen=True, slots=True)
 class Config:
     """Configuration management for translation workflow"""
     
     # Core settings
-    api_key: str = field(default_factory=lambda: Config._env_required('API_KEY'))
-    input_files: str = field(default_factory=lambda: Config._env_optional('INPUT_FILES', ''))
-    output_files: str = field(default_factory=lambda: Config._env_required('OUTPUT_FILES'))
+    api_key: str
+    output_files: str
+    input_files: str = ''
     
     # API settings
-    base_url: str = field(default_factory=lambda: os.getenv('BASE_URL', 'https://openrouter.ai/api/v1').strip())
-    ai_model: str = field(default_factory=lambda: os.getenv('AI_MODEL', 'gpt-4').strip())
-    target_lang: str = field(default_factory=lambda: os.getenv('TARGET_LANG', 'Simplified-Chinese').strip())
-    temperature: float = field(default_factory=lambda: float(os.getenv('TEMPERATURE', '0.3').strip()))
-    pr_title: str = field(default_factory=lambda: os.getenv('PR_TITLE', 'Add LLM Translations V3').strip())
+    base_url: str = 'https://openrouter.ai/api/v1'
+    ai_model: str = 'gpt-4'
+    target_lang: str = 'Simplified-Chinese'
+    temperature: float = 0.3
+    pr_title: str = 'Add LLM Translations V3'
     
-    # Refinement settings
-    refine_enabled: bool = field(default_factory=lambda: os.getenv('REFINE_ENABLED', 'true').strip().lower() == 'true')
-    refine_ai_model: str = field(init=False)
-    refine_temperature: float = field(init=False)
+    # Refinement settings (default to the translation model and temperature)
+    refine_enabled: bool = True
+    refine_ai_model: str = ''
+    refine_temperature: Optional[float] = None
     
     # Prompts
-    system_prompt: str = field(default_factory=lambda: Config._read_prompt('SYSTEM_PROMPT'))
-    prompt: str = field(default_factory=lambda: Config._read_prompt('PROMPT'))
-    refine_system_prompt: str = field(default_factory=lambda: Config._read_prompt('REFINE_SYSTEM_PROMPT'))
-    refine_prompt: str = field(default_factory=lambda: Config._read_prompt('REFINE_PROMPT'))
+    system_prompt: str = ''
+    prompt: str = ''
+    refine_system_prompt: str = ''
+    refine_prompt: str = ''
+    
+    # Skip every git command and GitHub API call (translations are still written)
+    dry_run: bool = False
     
     def __post_init__(self):
-        self.refine_ai_model = os.getenv('REFINE_AI_MODEL', self.ai_model).strip()
-        self.refine_temperature = float(os.getenv('REFINE_TEMPERATURE', str(self.temperature)).strip())
+        # Frozen dataclass: derived defaults have to bypass __setattr__
+        if not self.refine_ai_model:
+            object.__setattr__(self, 'refine_ai_model', self.ai_model)
+        if self.refine_temperature is None:
+            object.__setattr__(self, 'refine_temperature', self.temperature)
+    
+    @classmethod
+    def from_env(cls) -> 'Config':
+        """Build configuration from environment variables in a single pass"""
+        env = os.environ
+        ai_model = env.get('AI_MODEL', 'gpt-4').strip()
+        temperature = float(env.get('TEMPERATURE', '0.3').strip())
+        
+        return cls(
+            api_key=cls._env_required('API_KEY'),
+            output_files=cls._env_required('OUTPUT_FILES'),
+            input_files=cls._env_optional('INPUT_FILES', ''),
+            base_url=env.get('BASE_URL', 'https://openrouter.ai/api/v1').strip(),
+            ai_model=ai_model,
+            target_lang=env.get('TARGET_LANG', 'Simplified-Chinese').strip(),
+            temperature=temperature,
+            pr_title=env.get('PR_TITLE', 'Add LLM Translations V3').strip(),
+            refine_enabled=env.get('REFINE_ENABLED', 'true').strip().lower() == 'true',
+            refine_ai_model=env.get('REFINE_AI_MODEL', ai_model).strip(),
+            refine_temperature=float(env.get('REFINE_TEMPERATURE', str(temperature)).strip()),
+            system_prompt=cls._read_prompt('SYSTEM_PROMPT'),
+            prompt=cls._read_prompt('PROMPT'),
+            refine_system_prompt=cls._read_prompt('REFINE_SYSTEM_PROMPT'),
+            refine_prompt=cls._read_prompt('REFINE_PROMPT'),
+            dry_run=env.get('DRY_RUN', 'false').strip().lower() == 'true',
+        )
+    
+    @classmethod
+    def get(cls) -> 'Config':
+        """Return the shared configuration, building it from the environment once"""
+        global _CONFIG_SINGLETON
+        if _CONFIG_SINGLETON is None:
+            _CONFIG_SINGLETON = cls.from_env()
+        return _CONFIG_SINGLETON
+    
+    @classmethod
+    def reset(cls) -> None:
+        """Forget the shared configuration so the next get() rebuilds it"""
+        global _CONFIG_SINGLETON
+        _CONFIG_SINGLETON = None
     
     @staticmethod
     def _env_required(name: str) -> str:
@@ -51,9 +109,18 @@ class Config:
     @staticmethod
     def _read_prompt(env_name: str) -> str:
         prompt_text = os.getenv(env_name, '').strip()
-        if Path(prompt_text).is_file():
+        if not prompt_text:
+            return prompt_text
+        
+        # A single stat tells whether the value names a file and keys the content cache
+        try:
+            prompt_stat = os.stat(prompt_text)
+        except (OSError, ValueError):
+            return prompt_text
+        
+        if stat.S_ISREG(prompt_stat.st_mode):
             try:
-                return Path(prompt_text).read_text(encoding='utf-8')
+                return _read_prompt_file(prompt_text, prompt_stat.st_mtime_ns)
             except Exception as e:
                 print(f"Warning: Could not read prompt from file {prompt_text}: {e}")
         return prompt_text
@@ -70,6 +137,8 @@ class Config:
         print(f"Output Files: {self.output_files}")
         print(f"PR Title: {self.pr_title}")
         print(f"Refinement Enabled: {self.refine_enabled}")
+        if self.dry_run:
+            print("Dry Run: git and GitHub API calls are skipped")
         
         if self.refine_enabled:
             print(f"Refinement AI Model: {self.refine_ai_model}")
@@ -2,9 +2,67 @@
 
 import os
 import re
-import yaml
+import sys
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import takewhile
 from pathlib import Path
-from typing import List, Dict, Tuple, Optional, Any
+from typing import List, Dict, Tuple, Optional, Any, Iterator
+
+
+# Set GPT_TRANSLATE_VERBOSE=1 to print path-resolution diagnostics (extra listdir/stat calls)
+VERBOSE = os.getenv('GPT_TRANSLATE_VERBOSE', '').strip().lower() in ('1', 'true')
+
+_FRONTMATTER_RE = re.compile(r'^---\s*\n(.*?)\n---\s*\n(.*)', re.DOTALL)
+_PLACEHOLDER_RE = re.compile(r'\*|\{name\}|\{ext\}|\{lang\}')
+_LANG_CODE_TABLE = str.maketrans({' ': '_', '-': '_'})
+
+
+def _scan_files(directory: str) -> Iterator[str]:
+    """Yield file paths under directory, reusing the file type from readdir"""
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _scan_files(entry.path)
+            elif entry.is_file():
+                yield entry.path
+
+
+@lru_cache(maxsize=None)
+def _lang_code(target_lang: str) -> str:
+    """Normalize a target language for the {lang} placeholder (interned, one per language)"""
+    return sys.intern(target_lang.lower().translate(_LANG_CODE_TABLE))
+
+
+@dataclass(frozen=True)
+class OutputPlan:
+    """Decisions about an output pattern that do not depend on the input file"""
+    literal: bool = False        # No '*': the pattern is the output path
+    basename_only: bool = False  # Only '*' wildcards: substitute the file name
+    double_star: bool = False    # '**': preserve directory structure under base_dir
+    base_dir: str = ''
+
+
+@lru_cache(maxsize=None)
+def _plan_output_format(output_format: str) -> OutputPlan:
+    """Analyze an output pattern once; every file mapped with it reuses the plan"""
+    if not output_format or '*' not in output_format:
+        return OutputPlan(literal=True)
+    if '**' in output_format:
+        return OutputPlan(double_star=True, base_dir=sys.intern(output_format.partition('**')[0].rstrip('/')))
+    return OutputPlan(basename_only='{' not in output_format)
+
+
+def _debug_walk_components(path: str) -> None:
+    """Report the first component of path that does not exist (one stat per level)"""
+    existing_path = ""
+    for i, part in enumerate(path.split('/')):
+        test_path = part if i == 0 else f"{existing_path}/{part}"
+        if os.path.exists(test_path):
+            existing_path = test_path
+        else:
+            print(f"Debug: Path component not found: {part}")
+            break
 
 
 class FileProcessor:
@@ -17,70 +75,67 @@ class FileProcessor:
         """Parse and normalize input file paths
         
         Always splits input by spaces and checks each path individually.
-        Normalizes paths by removing leading './' if present.
+        Normalizes paths with os.path.normpath (dropping a leading './') and
+        skips paths that were already listed.
         """
-        if not self.config.input_files:
+        input_str = self.config.input_files
+        if not input_str:
             return []
         
-        input_str = self.config.input_files
-        print(f"Debug: Raw input files string: '{input_str}'")
+        cwd = os.getcwd()
         
-        # Print current directory and contents for debugging
-        print(f"Debug: Current working directory: {os.getcwd()}")
-        try:
-            print("Debug: Root directory contents:")
-            for item in os.listdir(os.getcwd()):
-                print(f"  - {item}")
-                
-            # Check if docs directory exists
-            if os.path.exists('docs'):
-                print("\nDebug: Contents of 'docs' directory:")
-                for item in os.listdir('docs'):
+        if VERBOSE:
+            print(f"Debug: Raw input files string: '{input_str}'")
+            
+            # Print current directory and contents for debugging
+            print(f"Debug: Current working directory: {cwd}")
+            try:
+                print("Debug: Root directory contents:")
+                for item in os.listdir(cwd):
                     print(f"  - {item}")
-        except Exception as e:
-            print(f"Debug: Error listing directory: {e}")
+                    
+                # Check if docs directory exists
+                if os.path.exists('docs'):
+                    print("\nDebug: Contents of 'docs' directory:")
+                    for item in os.listdir('docs'):
+                        print(f"  - {item}")
+            except Exception as e:
+                print(f"Debug: Error listing directory: {e}")
         
-        # Simply split by spaces - assume spaces are ALWAYS path separators
-        paths = [p.strip() for p in input_str.split() if p.strip()]
-        print(f"Debug: Split paths: {paths}")
+        # Simply split by spaces - assume spaces are ALWAYS path separators.
+        # str.split() already drops empty tokens and surrounding whitespace.
+        paths = input_str.split()
+        if VERBOSE:
+            print(f"Debug: Split paths: {paths}")
         
         # Process each path
         result = []
+        seen = set()
         for path in paths:
-            # Normalize path by removing leading './' if present
-            normalized = path[2:] if path.startswith('./') else path
-            
-            print(f"Debug: Checking path: '{path}' (normalized: '{normalized}')")
+            # Normalize lexically ('./a//b' -> 'a/b') and stat each path only once
+            normalized = os.path.normpath(path)
+            if normalized in seen:
+                continue
+            seen.add(normalized)
             
-            # Try both original and normalized paths
+            # Try both original and normalized paths (the original only if it differs)
             if os.path.exists(normalized):
-                print(f"Debug: Found normalized path: {normalized}")
+                if VERBOSE:
+                    print(f"Debug: Found normalized path: {normalized}")
                 result.append(normalized)
-            elif os.path.exists(path):
-                print(f"Debug: Found original path: {path}")
+            elif normalized != path and os.path.exists(path):
+                if VERBOSE:
+                    print(f"Debug: Found original path: {path}")
                 result.append(path)
             else:
                 # Path not found - add debug info
                 print(f"Warning: Path not found: {path}")
-                
-                # Try to identify where the path breaks
-                parts = normalized.split('/')
-                existing_path = ""
-                for i, part in enumerate(parts):
-                    if i == 0:
-                        test_path = part
-                    else:
-                        test_path = f"{existing_path}/{part}"
-                    
-                    if os.path.exists(test_path):
-                        existing_path = test_path
-                    else:
-                        print(f"Debug: Path component not found: {part}")
-                        break
+                if VERBOSE:
+                    _debug_walk_components(normalized)
         
         if not result:
             print(f"Error: No valid paths found in: {input_str}")
-            print(f"Current working directory: {os.getcwd()}")
+            print(f"Current working directory: {cwd}")
             print("\nTry using absolute paths or check that the files exist.")
             print("If running in Docker, make sure to mount the correct directory.")
             
@@ -88,93 +143,132 @@ class FileProcessor:
     
     def get_output_path(self, input_path: str) -> str:
         """Generate output path based on input and pattern"""
-        if not self.config.output_files or '*' not in self.config.output_files:
-            return self.config.output_files
+        config = self.config
+        return self._resolve_output_path(input_path, config.output_files, config.target_lang)
+    
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _resolve_output_path(input_path: str, output_format: str, target_lang: str) -> str:
+        """Map an input path to its output path, memoized per (input, pattern, language)
+        
+        The workflow asks for the same mapping repeatedly (once when translating
+        and again for every commit summary), so results are cached.
+        """
+        plan = _plan_output_format(output_format)
+        if plan.literal:
+            return output_format
         
-        input_path_obj = Path(input_path)
-        output_format = self.config.output_files
-        lang_code = self.config.target_lang.lower().replace(' ', '_').replace('-', '_')
+        # Plain '*' patterns: substitute the file name without building a Path
+        if plan.basename_only:
+            return output_format.replace('*', os.path.basename(input_path))
         
         # Handle directory structure preservation
-        if '**' in output_format:
-            if base_match := re.match(r'^(.*?)\*\*', output_format):
-                base_dir = base_match.group(1).rstrip('/')
-                return self._handle_directory_structure(input_path_obj, base_dir, output_format)
+        if plan.double_star:
+            return FileProcessor._handle_directory_structure(Path(input_path), plan.base_dir, output_format)
         
         # Simple replacement
-        return self._simple_replacement(input_path_obj, output_format, lang_code)
+        return FileProcessor._simple_replacement(input_path, output_format, _lang_code(target_lang))
     
-    def _handle_directory_structure(self, input_path: Path, base_dir: str, output_format: str) -> str:
+    @staticmethod
+    def _handle_directory_structure(input_path: Path, base_dir: str, output_format: str) -> str:
         """Handle complex directory structure preservation"""
         input_parts = str(input_path).split('/')
         
-        if '/' in base_dir:
-            base_parts = base_dir.split('/')
-            common_parts = []
-            
-            for i, part in enumerate(base_parts):
-                if i < len(input_parts) and input_parts[i] == part:
-                    common_parts.append(part)
-                else:
-                    break
-            
-            if common_parts:
-                skip_length = min(len(common_parts) + 1, len(input_parts) - 1)
-                relative_path = '/'.join(input_parts[skip_length:])
-                return f"{base_dir}/{relative_path}"
-        
-        # Fallback: skip first directory component
         if len(input_parts) > 1:
-            relative_path = '/'.join(input_parts[1:])
-            return f"{base_dir}/{relative_path}"
+            # The mapping only depends on the directory, so files in one directory share it
+            output_dir = FileProcessor._map_output_dir(tuple(input_parts[:-1]), base_dir)
+            return f"{output_dir}/{input_parts[-1]}"
         
         return str(Path(base_dir) / input_path.name)
     
-    def _simple_replacement(self, input_path: Path, output_format: str, lang_code: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _map_output_dir(dir_parts: Tuple[str, ...], base_dir: str) -> str:
+        """Map an input directory (as path parts) to its output directory under base_dir"""
+        # Fallback: skip first directory component
+        skip_length = 1
+        
+        if '/' in base_dir:
+            # Split literally: a leading './' must not match the input's first directory
+            base_parts = base_dir.split('/')
+            common_length = sum(1 for _ in takewhile(lambda pair: pair[0] == pair[1], zip(base_parts, dir_parts)))
+            if common_length:
+                skip_length = min(common_length + 1, len(dir_parts))
+        
+        relative_dir = '/'.join(dir_parts[skip_length:])
+        return f"{base_dir}/{relative_dir}" if relative_dir else base_dir
+    
+    @staticmethod
+    def _simple_replacement(input_path: str, output_format: str, lang_code: str) -> str:
         """Handle simple pattern replacement"""
+        name = os.path.basename(input_path)
+        stem, suffix = os.path.splitext(name)
         replacements = {
-            '*': input_path.name,
-            '{name}': input_path.stem,
-            '{ext}': input_path.suffix[1:] if input_path.suffix.startswith('.') else input_path.suffix,
+            '*': name,
+            '{name}': stem,
+            # Extensions repeat across files, so share one string object per extension
+            '{ext}': sys.intern(suffix[1:] if suffix.startswith('.') else suffix),
             '{lang}': lang_code
         }
         
-        result = output_format
-        for pattern, replacement in replacements.items():
-            result = result.replace(pattern, replacement)
-        
-        return result
+        # Substitute every placeholder in one pass over the pattern
+        return _PLACEHOLDER_RE.sub(lambda match: replacements[match.group(0)], output_format)
     
     def find_files_recursively(self, directory: str) -> List[str]:
         """Find all files in directory recursively"""
-        return [str(path) for path in Path(directory).rglob('*') if path.is_file()]
+        return list(_scan_files(directory))
     
-    def read_file(self, file_path: str) -> str:
-        """Read file content"""
+    def read_bytes(self, file_path: str) -> Optional[bytes]:
+        """Read raw file content, or None if the file cannot be read"""
         try:
-            return Path(file_path).read_text(encoding='utf-8')
+            with open(file_path, 'rb') as f:
+                return f.read()
         except Exception as e:
             print(f"Error reading file {file_path}: {e}")
-            return ""
+            return None
     
-    def write_file(self, file_path: str, content: str) -> bool:
-        """Write content to file"""
+    def write_bytes(self, file_path: str, data: bytes) -> bool:
+        """Write raw content to file, creating parent directories"""
         try:
-            path = Path(file_path)
-            path.parent.mkdir(parents=True, exist_ok=True)
-            path.write_text(content, encoding='utf-8')
+            if directory := os.path.dirname(file_path):
+                os.makedirs(directory, exist_ok=True)
+            with open(file_path, 'wb') as f:
+                f.write(data)
             return True
         except Exception as e:
             print(f"Error writing to file {file_path}: {e}")
             return False
     
+    def read_file(self, file_path: str) -> str:
+        """Read file content"""
+        data = self.read_bytes(file_path)
+        if data is None:
+            return ""
+        try:
+            return data.decode('utf-8')
+        except UnicodeDecodeError as e:
+            print(f"Error reading file {file_path}: {e}")
+            return ""
+    
+    def write_file(self, file_path: str, content: str) -> bool:
+        """Write content to file"""
+        return self.write_bytes(file_path, content.encode('utf-8'))
+    
     @staticmethod
     def extract_yaml_and_content(text: str) -> Tuple[Optional[Dict[str, Any]], str, bool]:
         """Extract YAML frontmatter and content"""
-        if yaml_match := re.match(r'^---\s*\n(.*?)\n---\s*\n(.*)', text, re.DOTALL):
+        # Most documents have no frontmatter; skip the regex for them
+        if not text.startswith('---'):
+            return None, text, False
+        
+        if yaml_match := _FRONTMATTER_RE.match(text):
+            import yaml  # Deferred: only needed when frontmatter is present
+            
             try:
                 yaml_text, content = yaml_match.groups()
-                yaml_data = yaml.safe_load(yaml_text)
+                # Prefer the libyaml-backed loader when PyYAML was built with it
+                loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+                yaml_data = yaml.load(yaml_text, Loader=loader)
                 return yaml_data, content, True
             except Exception as e:
                 print(f"Error parsing YAML frontmatter: {e}")
@@ -187,8 +281,11 @@ class FileProcessor:
         if not has_frontmatter or yaml_data is None:
             return content
         
+        import yaml  # Deferred: only needed when frontmatter is present
+        
         try:
-            yaml_text = yaml.dump(yaml_data, allow_unicode=True, sort_keys=False)
+            dumper = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+            yaml_text = yaml.dump(yaml_data, Dumper=dumper, allow_unicode=True, sort_keys=False)
             return f"---\n{yaml_text}---\n\n{content}"
         except Exception as e:
             print(f"Error reconstructing Markdown: {e}")
@@ -1,10 +1,15 @@
 #!/usr/bin/env python3
 
 import difflib
+from functools import lru_cache
 from typing import Optional, Dict
 from openai import OpenAI
 
 
+# Completions remembered per Translator; entries hold whole documents, so keep it small
+_COMPLETION_CACHE_SIZE = 128
+
+
 class Translator:
     """Handles AI translation services using OpenAI API"""
     
@@ -19,45 +24,87 @@ class Translator:
         self.input_tokens = 0
         self.output_tokens = 0
         self.api_calls = 0
+        # Cleared once the SDK or backend rejects stream_options, so later calls skip it
+        self._stream_usage_supported = True
+        
+        # Prompt pieces are fixed for the run (Config is frozen), so build them once
+        self._system_prompt = config.system_prompt or None
+        self._translate_prefix = f"{config.prompt}\n\n" if config.prompt else ""
+        self._refine_system_prompt = config.refine_system_prompt or None
+        self._refine_prefix = f"{config.refine_prompt}\n\n" if config.refine_prompt else ""
+        
+        # Deterministic (temperature 0) completions; failed or empty requests raise and are not cached
+        self._cached_completion = lru_cache(maxsize=_COMPLETION_CACHE_SIZE)(self._create_completion)
     
     def call_openai(self, model: str, user_prompt: str, 
                    system_prompt: Optional[str] = None, 
                    temperature: Optional[float] = None) -> str:
-        """Call OpenAI API"""
+        """Call OpenAI API
+        
+        At temperature 0 the model output is (near) deterministic, so repeated
+        identical requests are answered from a per-instance cache.
+        """
+        if temperature is None:
+            temperature = self.config.temperature
         try:
-            messages = []
-            if system_prompt:
-                messages.append({"role": "system", "content": system_prompt})
-            messages.append({"role": "user", "content": user_prompt})
-            
-            response = self.client.chat.completions.create(
-                model=model,
-                messages=messages,
-                temperature=temperature or self.config.temperature
-            )
-            
-            # Track usage
-            if hasattr(response, 'usage') and response.usage:
-                self.input_tokens += response.usage.prompt_tokens
-                self.output_tokens += response.usage.completion_tokens
-            
-            self.api_calls += 1
-            return response.choices[0].message.content
-            
+            if temperature == 0:
+                return self._cached_completion(model, user_prompt, system_prompt, temperature)
+            return self._create_completion(model, user_prompt, system_prompt, temperature)
         except Exception as e:
             print(f"Error calling OpenAI API: {e}")
             return ""
     
+    def _create_completion(self, model: str, user_prompt: str,
+                           system_prompt: Optional[str], temperature: float) -> str:
+        """Stream one chat completion, collecting its text and recording its usage"""
+        messages = []
+        if system_prompt:
+            messages.append({"role": "system", "content": system_prompt})
+        messages.append({"role": "user", "content": user_prompt})
+        
+        # Streaming drains the response as it is generated instead of waiting on
+        # one long-lived request; the final chunk carries the token usage
+        request = {"model": model, "messages": messages, "temperature": temperature, "stream": True}
+        if self._stream_usage_supported:
+            try:
+                stream = self.client.chat.completions.create(**request, stream_options={"include_usage": True})
+            except Exception as e:
+                # Older SDKs raise TypeError for the argument; some compatible backends
+                # reject it by name. Any other failure is the request's own problem.
+                if not isinstance(e, TypeError) and 'stream_options' not in str(e):
+                    raise
+                print(f"Warning: stream_options not supported ({e}), streaming without usage statistics")
+                stream = self.client.chat.completions.create(**request)
+                self._stream_usage_supported = False
+        else:
+            stream = self.client.chat.completions.create(**request)
+        
+        parts = []
+        usage = None
+        for chunk in stream:
+            if chunk.choices and (delta := chunk.choices[0].delta.content):
+                parts.append(delta)
+            if getattr(chunk, 'usage', None):
+                usage = chunk.usage
+        
+        # Track usage
+        if usage:
+            self.input_tokens += usage.prompt_tokens
+            self.output_tokens += usage.completion_tokens
+        
+        self.api_calls += 1
+        if not parts:
+            # Raise rather than return '' so the cache never keeps an empty answer
+            raise ValueError("empty completion returned")
+        return ''.join(parts)
+    
     def translate(self, text: str) -> str:
         """Translate text using OpenAI"""
-        system_prompt = self.config.system_prompt or None
-        user_prompt = f"{self.config.prompt}\n\n{text}" if self.config.prompt else text
-        
         print(f"Translating with model: {self.config.ai_model}...")
         return self.call_openai(
             model=self.config.ai_model,
-            user_prompt=user_prompt,
-            system_prompt=system_prompt,
+            user_prompt=self._translate_prefix + text,
+            system_prompt=self._system_prompt,
             temperature=self.config.temperature
         )
     
@@ -66,25 +113,17 @@ class Translator:
         if not self.config.refine_enabled:
             return translated_text
         
-        system_prompt = self.config.refine_system_prompt or None
-        
         # Build user prompt
-        if self.config.refine_prompt:
-            user_prompt = f"{self.config.refine_prompt}\n\n"
-            if original_text:
-                user_prompt += f"Original text:\n{original_text}\n\nTranslated text to refine:\n{translated_text}"
-            else:
-                user_prompt += translated_text
-        elif original_text:
-            user_prompt = f"Original text:\n{original_text}\n\nTranslated text to refine:\n{translated_text}"
+        if original_text:
+            user_prompt = f"{self._refine_prefix}Original text:\n{original_text}\n\nTranslated text to refine:\n{translated_text}"
         else:
-            user_prompt = translated_text
+            user_prompt = self._refine_prefix + translated_text
         
         print(f"Refining translation with model: {self.config.refine_ai_model}...")
         result = self.call_openai(
             model=self.config.refine_ai_model,
             user_prompt=user_prompt,
-            system_prompt=system_prompt,
+            system_prompt=self._refine_system_prompt,
             temperature=self.config.refine_temperature
         )
         
@@ -105,6 +144,11 @@ class TextUtils:
     @staticmethod
     def show_diff(text1: str, text2: str) -> None:
         """Show differences between two texts"""
+        # Refinement often returns the translation unchanged; skip the O(N*M) matcher then
+        if text1 == text2:
+            print("No differences found between translations.")
+            return
+        
         lines1 = text1.splitlines()
         lines2 = text2.splitlines()
         
@@ -116,9 +160,9 @@ class TextUtils:
         ))
         
         if diff_lines:
+            # One write for the whole diff instead of a print per line
             print("\n=== Translation Differences ===")
-            for line in diff_lines:
-                print(line)
+            print("\n".join(diff_lines))
             print("===============================\n")
         else:
             print("No differences found between translations.")
@@ -2,6 +2,7 @@ import unittest
 from unittest.mock import patch, MagicMock
 import os
 import sys
+import tempfile
 
 # Mock external dependencies to avoid ModuleNotFoundError in a clean test environment
 sys.modules['openai'] = MagicMock()
@@ -29,7 +30,7 @@ class TestConfig(unittest.TestCase):
         """
         # We need to mock the prompts as they read from files
         with patch('src.config.Config._read_prompt', return_value="dummy_prompt"):
-            config = Config()
+            config = Config.from_env()
 
             # Assert that all string-based configurations have been stripped
             self.assertEqual(config.api_key, 'test_key')
@@ -51,7 +52,7 @@ class TestConfig(unittest.TestCase):
         """
         # We need to mock the prompts as they read from files
         with patch('src.config.Config._read_prompt', return_value="dummy_prompt"):
-            config = Config()
+            config = Config.from_env()
 
             # Assert that input_files is empty string but doesn't cause an error
             self.assertEqual(config.input_files, '')
@@ -60,5 +61,70 @@ class TestConfig(unittest.TestCase):
             self.assertEqual(config.output_files, './output/')
             self.assertEqual(config.target_lang, 'Simplified-Chinese')
 
+    def test_read_prompt_file_refreshes_on_change(self):
+        """
+        Tests that prompt files are served from cache until they are modified.
+        """
+        with tempfile.TemporaryDirectory() as temp_dir:
+            prompt_file = os.path.join(temp_dir, 'prompt.txt')
+            with open(prompt_file, 'w', encoding='utf-8') as f:
+                f.write('first')
+
+            with patch.dict(os.environ, {'PROMPT': prompt_file}):
+                self.assertEqual(Config._read_prompt('PROMPT'), 'first')
+
+                with open(prompt_file, 'w', encoding='utf-8') as f:
+                    f.write('second')
+                stat = os.stat(prompt_file)
+                os.utime(prompt_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+                self.assertEqual(Config._read_prompt('PROMPT'), 'second')
+
+    @patch.dict(os.environ, {
+        'API_KEY': 'test_key',
+        'OUTPUT_FILES': './output/',
+        'AI_MODEL': 'test-model',
+        'TEMPERATURE': '0.5',
+        'REFINE_AI_MODEL': '',
+    })
+    def test_config_refine_settings_default_to_translation_settings(self):
+        """
+        Tests that an unset or empty refinement model/temperature falls back to
+        the translation settings, and that the resulting config is immutable.
+        """
+        with patch('src.config.Config._read_prompt', return_value=""):
+            config = Config.from_env()
+
+        self.assertEqual(config.refine_ai_model, 'test-model')
+        self.assertEqual(config.refine_temperature, 0.5)
+        self.assertFalse(config.dry_run)
+        with self.assertRaises(AttributeError):
+            config.ai_model = 'other-model'
+
+    @patch.dict(os.environ, {
+        'API_KEY': 'test_key',
+        'OUTPUT_FILES': 'out/*',
+    })
+    def test_shared_instances_are_reused_until_reset(self):
+        """
+        Tests that the package-level getters hand out one Config/FileProcessor
+        and that reset_for_tests() forces them to be rebuilt.
+        """
+        import src
+
+        src.reset_for_tests()
+        self.addCleanup(src.reset_for_tests)
+        with patch('src.config.Config._read_prompt', return_value=""):
+            config = src.get_config()
+            file_processor = src.get_file_processor()
+
+            self.assertIs(src.get_config(), config)
+            self.assertIs(src.get_file_processor(), file_processor)
+            self.assertIs(file_processor.config, config)
+
+            src.reset_for_tests()
+            self.assertIsNot(src.get_config(), config)
+            self.assertIsNot(src.get_file_processor(), file_processor)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -67,6 +67,73 @@ class TestFileProcessor(unittest.TestCase):
         actual_output = self.file_processor.get_output_path(input_path)
         self.assertEqual(actual_output, expected_output)
 
+    def test_get_output_path_with_dot_slash_base_dir(self):
+        """Tests that a './' prefix on the output base dir is kept as a literal path segment"""
+        self.mock_config.output_files = "./docs/cn/**"
+        self.mock_config.target_lang = "Simplified-Chinese"
+
+        # './' never matches the input's first directory, so only that directory is dropped
+        self.assertEqual(self.file_processor.get_output_path("docs/en/a.md"), "./docs/cn/en/a.md")
+        self.assertEqual(self.file_processor.get_output_path("docs/en/guides/b.md"), "./docs/cn/en/guides/b.md")
+
+    def test_get_output_path_with_placeholders(self):
+        """Tests that get_output_path substitutes name/ext/lang placeholders"""
+        self.mock_config.output_files = "i18n/{lang}/{name}-*.{ext}"
+        self.mock_config.target_lang = "Brazilian Portuguese"
+
+        actual_output = self.file_processor.get_output_path("docs/en/readme.md")
+        self.assertEqual(actual_output, "i18n/brazilian_portuguese/readme-readme.md.md")
+
+    def test_get_output_path_follows_config_changes(self):
+        """Tests that memoized output paths are keyed on the current output pattern and language"""
+        self.mock_config.output_files = "out/{lang}/*"
+        self.mock_config.target_lang = "Simplified-Chinese"
+        self.assertEqual(self.file_processor.get_output_path("docs/intro.md"), "out/simplified_chinese/intro.md")
+        self.assertEqual(self.file_processor.get_output_path("docs/intro.md"), "out/simplified_chinese/intro.md")
+
+        self.mock_config.target_lang = "French"
+        self.assertEqual(self.file_processor.get_output_path("docs/intro.md"), "out/french/intro.md")
+
+        self.mock_config.output_files = "fr/*"
+        self.assertEqual(self.file_processor.get_output_path("docs/intro.md"), "fr/intro.md")
+
+    def test_find_files_recursively(self):
+        """Test that find_files_recursively returns files from nested directories only"""
+        nested_dir = self.test_dir / "en" / "guides"
+        nested_dir.mkdir(parents=True)
+        (self.test_dir / "en" / "index.md").touch()
+        (nested_dir / "intro.md").touch()
+        (self.test_dir / "empty").mkdir()
+
+        result = self.file_processor.find_files_recursively(str(self.test_dir))
+
+        self.assertEqual(sorted(result), sorted([
+            str(self.test_dir / "en" / "index.md"),
+            str(nested_dir / "intro.md"),
+        ]))
+
+    def test_write_file_and_read_file(self):
+        """Test write_file creates parent directories and read_file round-trips UTF-8 content"""
+        path = str(self.test_dir / "cn" / "sub" / "b.md")
+
+        self.assertTrue(self.file_processor.write_file(path, "内容 B"))
+        self.assertEqual(self.file_processor.read_file(path), "内容 B")
+
+    def test_extract_yaml_and_content_without_frontmatter(self):
+        """Test documents without a leading fence are returned untouched"""
+        text = "# Title\n\n---\nnot: frontmatter\n---\n"
+
+        self.assertEqual(FileProcessor.extract_yaml_and_content(text), (None, text, False))
+
+    def test_write_bytes_and_read_bytes(self):
+        """Test the byte helpers pass content through unchanged"""
+        path = str(self.test_dir / "cn" / "raw.md")
+        data = "---\ntitle: 标题\n---\n正文".encode('utf-8')
+
+        self.assertTrue(self.file_processor.write_bytes(path, data))
+        self.assertEqual(self.file_processor.read_bytes(path), data)
+        self.assertIsNone(self.file_processor.read_bytes(str(self.test_dir / "missing.md")))
+
     def test_get_input_files_single_path(self):
         """Test get_input_files with a single file path"""
         # Create a test file
@@ -163,7 +230,16 @@ class TestFileProcessor(unittest.TestCase):
                 result = self.file_processor.get_input_files()
                 self.assertEqual(len(result), 3)
                 self.assertEqual(result, normalized_paths)
-    
+
+    def test_get_input_files_deduplicates_paths(self):
+        """Test get_input_files stats and returns a repeated path only once"""
+        self.mock_config.input_files = "./docs/en/guide.md docs/en/guide.md docs//en/guide.md"
+
+        with patch('os.path.exists', return_value=True) as mock_exists:
+            result = self.file_processor.get_input_files()
+            self.assertEqual(result, ["docs/en/guide.md"])
+            mock_exists.assert_called_once_with("docs/en/guide.md")
+
     def test_get_input_files_empty_input(self):
         """Test get_input_files with empty input"""
         # Configure mock
@@ -229,6 +305,20 @@ class TestFileProcessor(unittest.TestCase):
                     self.assertIn("docs/en/sql-reference/200-sql-functions/006-string-functions/char.md", result)
                     self.assertIn("docs/en/sql-reference/200-sql-functions/006-string-functions/index.md", result)
 
+    def test_get_input_files_skips_diagnostics_when_not_verbose(self):
+        """Test that directory listings and component probes only run in verbose mode"""
+        self.mock_config.input_files = "./docs/en/missing.md"
+
+        with patch('src.file_processor.VERBOSE', False), \
+             patch('os.path.exists', return_value=False) as mock_exists, \
+             patch('os.listdir') as mock_listdir:
+            result = self.file_processor.get_input_files()
+
+        self.assertEqual(result, [])
+        mock_listdir.assert_not_called()
+        # One probe for the normalized path and one for the original spelling
+        self.assertEqual(mock_exists.call_count, 2)
+
     def test_get_input_files_space_separator(self):
         """Test that input_files with space separator is correctly parsed into multiple paths"""
         # Set up a simple space-separated input string
@@ -19,6 +19,7 @@ class TestGitOperations(unittest.TestCase):
     def setUp(self):
         """Set up a mock config and GitOperations instance."""
         self.mock_config = MagicMock(spec=Config)
+        self.mock_config.dry_run = False
         
         # Mock environment variables for a typical GitHub Actions run
         self.patcher = patch.dict(os.environ, {
@@ -37,8 +38,8 @@ class TestGitOperations(unittest.TestCase):
         self.patcher.stop()
 
     @patch('src.git_operations.GitOperations._create_pr_with_cli')
-    @patch('src.git_operations.requests')
-    def test_create_pull_request_api_call(self, mock_requests, mock_create_pr_with_cli):
+    @patch.dict(sys.modules, {'requests': MagicMock()})
+    def test_create_pull_request_api_call(self, mock_create_pr_with_cli):
         """
         Tests that create_pull_request makes the correct API call
         by simulating a failure in the CLI method.
@@ -50,7 +51,8 @@ class TestGitOperations(unittest.TestCase):
         mock_response = MagicMock()
         mock_response.status_code = 201
         mock_response.json.return_value = {'number': 123, 'html_url': 'http://example.com/pr/123'}
-        mock_requests.post.return_value = mock_response
+        mock_session = sys.modules['requests'].Session.return_value
+        mock_session.post.return_value = mock_response
 
         pr_number = self.git_ops.create_pull_request(
             branch_name='test-branch',
@@ -65,7 +67,8 @@ class TestGitOperations(unittest.TestCase):
         expected_url = 'https://api.github.com/repos/test_owner/test_repo/pulls'
         expected_headers = {
             'Authorization': 'token test_token',
-            'Accept': 'application/vnd.github.v3+json'
+            'Accept': 'application/vnd.github.v3+json',
+            'X-GitHub-Api-Version': '2022-11-28'
         }
         expected_data = {
             'title': 'Test PR',
@@ -74,16 +77,43 @@ class TestGitOperations(unittest.TestCase):
             'base': 'main',
             'draft': True
         }
-        mock_requests.post.assert_called_once_with(
-            expected_url, headers=expected_headers, json=expected_data
+        mock_session.headers.update.assert_called_once_with(expected_headers)
+        mock_session.post.assert_called_once_with(
+            expected_url, json=expected_data, timeout=(3.05, 30)
         )
 
-    @patch('src.git_operations.requests')
-    def test_update_pull_request_api_call(self, mock_requests):
+        # The pooled session is released on close and rebuilt on next use
+        self.git_ops.close()
+        mock_session.close.assert_called_once_with()
+        self.assertIsNone(self.git_ops._session)
+
+    @patch('src.git_operations.GitOperations._create_pr_with_cli', return_value=456)
+    @patch('src.git_operations.GitOperations._create_pr_with_api', return_value=123)
+    def test_create_pull_request_uses_cli_only_when_requested(self, mock_create_pr_with_api, mock_create_pr_with_cli):
+        """Tests that the gh CLI is opt-in and the API is used by default."""
+        self.git_ops._gh_available = True
+
+        self.assertEqual(self.git_ops.create_pull_request('test-branch', 'Test PR', ['body']), 123)
+        mock_create_pr_with_cli.assert_not_called()
+
+        self.assertEqual(self.git_ops.create_pull_request('test-branch', 'Test PR', ['body'], use_gh_cli=True), 456)
+        mock_create_pr_with_api.assert_called_once()
+
+    @patch('src.git_operations.GitOperations._create_pr_with_cli', return_value=None)
+    @patch('src.git_operations.GitOperations._create_pr_with_api', return_value=123)
+    def test_create_pull_request_accepts_body_string(self, mock_create_pr_with_api, mock_create_pr_with_cli):
+        """Tests that a prebuilt body string is passed through unchanged."""
+        self.git_ops.create_pull_request('test-branch', 'Test PR', '# Body\n\nText')
+
+        mock_create_pr_with_api.assert_called_once_with('test-branch', 'Test PR', '# Body\n\nText', False)
+
+    @patch.dict(sys.modules, {'requests': MagicMock()})
+    def test_update_pull_request_api_call(self):
         """Tests that update_pull_request makes the correct API call."""
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_requests.patch.return_value = mock_response
+        mock_session = sys.modules['requests'].Session.return_value
+        mock_session.patch.return_value = mock_response
 
         success = self.git_ops.update_pull_request(
             pr_number=123,
@@ -95,9 +125,218 @@ class TestGitOperations(unittest.TestCase):
         
         expected_url = 'https://api.github.com/repos/test_owner/test_repo/pulls/123'
         expected_data = {'title': 'Updated Title', 'body': 'Updated Body'}
-        mock_requests.patch.assert_called_once_with(
-            expected_url, headers=unittest.mock.ANY, json=expected_data
+        mock_session.patch.assert_called_once_with(
+            expected_url, json=expected_data, timeout=unittest.mock.ANY
+        )
+
+    @patch('src.git_operations.GitOperations._mark_ready_with_api', return_value=False)
+    @patch('src.git_operations.GitOperations._create_pr_with_api', return_value=7)
+    @patch('src.git_operations.GitOperations.run_command')
+    def test_pull_request_skips_cli_when_gh_missing(self, mock_run_command, mock_create_pr_with_api, mock_mark_ready_with_api):
+        """Tests that the gh CLI is never spawned when it is not installed."""
+        with patch('shutil.which', return_value=None), patch.dict(os.environ, {'GPT_TRANSLATE_PREFER_API': '0'}):
+            git_ops = GitOperations(self.mock_config)
+
+        self.assertEqual(git_ops.create_pull_request('test-branch', 'Test PR', ['body']), 7)
+        self.assertFalse(git_ops.mark_pr_ready_for_review(7))
+        mock_mark_ready_with_api.assert_called_once_with(7)
+        mock_run_command.assert_not_called()
+
+    @patch.dict(sys.modules, {'requests': MagicMock()})
+    @patch('src.git_operations.GitOperations.run_command')
+    def test_mark_pr_ready_for_review_uses_graphql(self, mock_run_command):
+        """Tests that a draft PR is marked ready through the GraphQL API without spawning gh."""
+        mock_session = sys.modules['requests'].Session.return_value
+        mock_session.get.return_value = MagicMock(status_code=200, json=lambda: {'node_id': 'PR_node'})
+        mock_session.post.return_value = MagicMock(status_code=200, json=lambda: {'data': {}})
+        self.git_ops._gh_available = True
+
+        self.assertTrue(self.git_ops.mark_pr_ready_for_review(123))
+
+        mock_session.get.assert_called_once_with(
+            'https://api.github.com/repos/test_owner/test_repo/pulls/123', timeout=unittest.mock.ANY
         )
+        url, = mock_session.post.call_args.args
+        payload = mock_session.post.call_args.kwargs['json']
+        self.assertEqual(url, 'https://api.github.com/graphql')
+        self.assertIn('markPullRequestReadyForReview', payload['query'])
+        self.assertEqual(payload['variables'], {'id': 'PR_node'})
+        mock_run_command.assert_not_called()
+
+        # PRs created through the API reuse the node ID from the creation response
+        mock_session.get.reset_mock()
+        mock_session.post.return_value = MagicMock(
+            status_code=201, json=lambda: {'number': 124, 'node_id': 'PR_new', 'html_url': ''}
+        )
+        self.assertEqual(self.git_ops.create_pull_request('test-branch', 'Test PR', ['body'], draft=True), 124)
+        mock_session.post.return_value = MagicMock(status_code=200, json=lambda: {'data': {}})
+
+        self.assertTrue(self.git_ops.mark_pr_ready_for_review(124))
+        mock_session.get.assert_not_called()
+        self.assertEqual(mock_session.post.call_args.kwargs['json']['variables'], {'id': 'PR_new'})
+
+    @patch.dict(sys.modules, {'requests': MagicMock()})
+    @patch('subprocess.run')
+    def test_dry_run_spawns_nothing_and_sends_no_requests(self, mock_run):
+        """Tests that a dry-run config skips every git command and GitHub API call."""
+        self.mock_config.dry_run = True
+        git_ops = GitOperations(self.mock_config)
+
+        branch_name = git_ops.prepare_git_branch()
+        self.assertTrue(branch_name.startswith('translation-'))
+        self.assertEqual(git_ops.run_command(['git', 'status'], text=False), (0, b'', b''))
+        self.assertEqual(git_ops.commit_and_push(['out.md'], 'msg', branch_name), branch_name)
+        self.assertIsNone(git_ops.create_pull_request(branch_name, 'Test PR', ['body']))
+        self.assertTrue(git_ops.update_pull_request(1, title='Title'))
+        self.assertTrue(git_ops.mark_pr_ready_for_review(1))
+
+        mock_run.assert_not_called()
+        sys.modules['requests'].Session.assert_not_called()
+
+    @patch('src.git_operations.GitOperations.run_command')
+    def test_commit_and_push_reuses_checked_out_branch(self, mock_run_command):
+        """Tests that repeated commits to the same branch skip the branch lookup and checkout."""
+        # `git diff --cached --quiet` exits 1 when there are staged changes
+        mock_run_command.side_effect = lambda command, **_: (1 if command[1] == 'diff' else 0, ' M out.md', '')
+
+        for _ in range(2):
+            self.assertEqual(self.git_ops.commit_and_push(['out.md'], 'msg', 'test-branch'), 'test-branch')
+
+        commands = [args[0] for args, _ in mock_run_command.call_args_list]
+        self.assertEqual(commands.count(['git', 'branch', '--list', 'test-branch']), 1)
+        self.assertEqual(commands.count(['git', 'checkout', 'test-branch']), 1)
+
+    @patch('src.git_operations.GitOperations.run_command', return_value=(0, b'', ''))
+    def test_prepare_git_branch_creates_branch_with_ref_updates(self, mock_run_command):
+        """Tests that a new branch is created via update-ref/symbolic-ref, not checkout -b."""
+        self.assertEqual(self.git_ops.prepare_git_branch('test-branch'), 'test-branch')
+
+        commands = [args[0] for args, _ in mock_run_command.call_args_list]
+        self.assertIn(['git', 'update-ref', 'refs/heads/test-branch', 'HEAD', ''], commands)
+        self.assertIn(['git', 'symbolic-ref', 'HEAD', 'refs/heads/test-branch'], commands)
+        self.assertNotIn(['git', 'checkout', '-b', 'test-branch'], commands)
+
+    @patch('src.git_operations.GitOperations.run_command', return_value=(0, '', ''))
+    def test_commit_and_push_stops_when_nothing_is_staged(self, mock_run_command):
+        """Tests that no commit or push is attempted when git add staged nothing."""
+        self.assertIsNone(self.git_ops.commit_and_push(['out.md'], 'msg', 'test-branch'))
+
+        commands = [args[0][:2] for args, _ in mock_run_command.call_args_list]
+        self.assertIn(['git', 'diff'], commands)
+        self.assertNotIn(['git', 'status'], commands)
+        self.assertNotIn(['git', 'commit'], commands)
+        self.assertNotIn(['git', 'push'], commands)
+
+    @patch('src.git_operations.GitOperations.run_command')
+    def test_commit_and_push_treats_nothing_to_commit_as_no_changes(self, mock_run_command):
+        """Tests that git's 'nothing to commit' (printed on stdout) skips the push."""
+        def run_command(command, **kwargs):
+            if command[1] == 'diff':
+                return 1, b'', b''
+            if command[1] == 'commit':
+                return 1, b'On branch test-branch\nnothing to commit, working tree clean\n', b''
+            return 0, '', ''
+        mock_run_command.side_effect = run_command
+
+        self.assertIsNone(self.git_ops.commit_and_push(['out.md'], 'msg', 'test-branch'))
+        commands = [args[0][:2] for args, _ in mock_run_command.call_args_list]
+        self.assertNotIn(['git', 'push'], commands)
+
+    @patch('src.git_operations.GitOperations.run_command')
+    def test_create_pr_with_cli_parses_pr_number(self, mock_run_command):
+        """Tests that the PR number is taken from the URL printed by gh."""
+        mock_run_command.return_value = (0, 'https://github.com/test_owner/test_repo/pull/42\n', '')
+        self.assertEqual(self.git_ops._create_pr_with_cli('Test PR', 'body'), 42)
+
+        mock_run_command.return_value = (0, 'no url here\n', '')
+        self.assertIsNone(self.git_ops._create_pr_with_cli('Test PR', 'body'))
+
+    @patch('src.git_operations.GitOperations.run_command', return_value=(0, 'https://github.com/o/r/pull/7\n', ''))
+    def test_create_pr_with_cli_targets_workflow_branch(self, mock_run_command):
+        """Tests that the gh CLI path targets the branch from GITHUB_REF, like the API path."""
+        with patch.dict(os.environ, {'GITHUB_REF': 'refs/heads/release-1.0'}):
+            git_ops = GitOperations(self.mock_config)
+
+        git_ops._create_pr_with_cli('Test PR', 'body')
+        command = mock_run_command.call_args.args[0]
+        self.assertEqual(command[command.index('--base') + 1], 'release-1.0')
+
+    @patch('subprocess.run')
+    def test_setup_git_passes_identity_through_environment(self, mock_run):
+        """Tests that setup_git sets the commit identity via env instead of git config calls."""
+        mock_run.return_value = MagicMock(returncode=0, stdout='', stderr='')
+
+        self.assertTrue(self.git_ops.setup_git())
+        commands = [args[0] for args, _ in mock_run.call_args_list]
+        self.assertNotIn(['git', 'config', '--global', 'user.name', 'github-actions[bot]'], commands)
+        self.assertEqual([command[:3] for command in commands], [['git', 'config', '--global'], ['git', 'remote', 'set-url']])
+
+        # Later calls reuse the configuration without spawning git again
+        self.assertTrue(self.git_ops.setup_git())
+        self.assertEqual(mock_run.call_count, len(commands))
+
+        # The environment is read when the command runs, not when GitOperations was built
+        with patch.dict(os.environ, {'LATE_VARIABLE': '1'}):
+            self.git_ops.run_command(['git', 'commit', '-m', 'msg'])
+        env = mock_run.call_args.kwargs['env']
+        self.assertEqual(env['GIT_AUTHOR_NAME'], 'github-actions[bot]')
+        self.assertEqual(env['GIT_COMMITTER_EMAIL'], 'github-actions[bot]@users.noreply.github.com')
+        self.assertEqual(env['GIT_TERMINAL_PROMPT'], '0')
+        self.assertEqual(env['LC_ALL'], 'C')
+        self.assertEqual(env['GITHUB_REPOSITORY'], 'test_owner/test_repo')
+        self.assertEqual(env['LATE_VARIABLE'], '1')
+
+        # Non-git tools such as gh inherit the environment (and locale) untouched
+        self.git_ops.run_command(['gh', 'pr', 'ready', '1'])
+        self.assertIsNone(mock_run.call_args.kwargs['env'])
+
+    @patch('src.git_operations.GitOperations.run_command')
+    def test_add_files_uses_single_git_add(self, mock_run_command):
+        """Tests that files are staged with one git add, retrying once without missing files."""
+        mock_run_command.return_value = (0, '', '')
+
+        self.assertEqual(self.git_ops._add_files(['a.md', 'b.md']), 2)
+        mock_run_command.assert_called_once_with(['git', 'add', '--', 'a.md', 'b.md'], capture_stdout=False)
+
+        mock_run_command.reset_mock()
+        mock_run_command.side_effect = [(1, '', 'pathspec error'), (0, '', '')]
+
+        with patch('os.path.exists', side_effect=lambda path: path != 'missing.md'):
+            self.assertEqual(self.git_ops._add_files(['a.md', 'missing.md']), 1)
+        self.assertEqual(mock_run_command.call_count, 2)
+        mock_run_command.assert_called_with(['git', 'add', '--', 'a.md'], capture_stdout=False)
+
+        # When every file exists, the batch failure falls back to per-file adds
+        mock_run_command.reset_mock()
+        mock_run_command.side_effect = [(1, '', 'index error'), (0, '', ''), (1, '', 'bad file')]
+
+        with patch('os.path.exists', return_value=True):
+            self.assertEqual(self.git_ops._add_files(['a.md', 'b.md']), 1)
+        mock_run_command.assert_has_calls([
+            call(['git', 'add', '--', 'a.md'], capture_stdout=False),
+            call(['git', 'add', '--', 'b.md'], capture_stdout=False),
+        ])
+
+    @patch('src.git_operations.GitOperations.run_command', return_value=(0, '', ''))
+    def test_add_files_pipes_long_path_lists_on_stdin(self, mock_run_command):
+        """Tests that long path lists are passed to git add on stdin instead of argv."""
+        files = [f"docs/cn/{'x' * 1100}/{i}.md" for i in range(100)]
+
+        self.assertEqual(self.git_ops._add_files(files), 100)
+        mock_run_command.assert_called_once_with(
+            ['git', 'add', '--pathspec-from-file=-', '--pathspec-file-nul'],
+            input_text='\0'.join(files),
+            capture_stdout=False
+        )
+
+    @patch('src.git_operations.GitOperations.run_command', return_value=(0, '', ''))
+    def test_add_files_measures_path_lists_in_bytes(self, mock_run_command):
+        """Tests that non-ASCII paths are measured in encoded bytes, not characters."""
+        # ~40k characters but ~120k UTF-8 bytes
+        files = [f"docs/cn/{'文' * 1000}/{i}.md" for i in range(40)]
+
+        self.assertEqual(self.git_ops._add_files(files), 40)
+        self.assertEqual(mock_run_command.call_args.args[0][2], '--pathspec-from-file=-')
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
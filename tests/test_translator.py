@@ -0,0 +1,157 @@
+import unittest
+from unittest.mock import MagicMock, patch
+import os
+import sys
+
+# Mock external dependencies to avoid ModuleNotFoundError in a clean test environment
+sys.modules['openai'] = MagicMock()
+sys.modules['yaml'] = MagicMock()
+sys.modules['requests'] = MagicMock()
+
+# Add src to path to allow direct import
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.translator import Translator, TextUtils
+from src.config import Config
+
+class TestTranslator(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a mock config and a Translator with a mocked OpenAI client."""
+        self.mock_config = MagicMock(spec=Config)
+        self.mock_config.api_key = 'test_key'
+        self.mock_config.base_url = 'https://example.com/api/v1'
+        self.mock_config.ai_model = 'test-model'
+        self.mock_config.temperature = 0.3
+        self.mock_config.system_prompt = ''
+        self.mock_config.prompt = ''
+        self.mock_config.refine_enabled = True
+        self.mock_config.refine_ai_model = 'refine-model'
+        self.mock_config.refine_temperature = 0.3
+        self.mock_config.refine_system_prompt = 'Be precise.'
+        self.mock_config.refine_prompt = 'Improve this.'
+
+        self.translator = Translator(self.mock_config)
+        self.translator.client = MagicMock()
+
+    def _echo_response(self, **kwargs):
+        """Build a fake completion stream that echoes the user prompt back in upper case."""
+        text = kwargs['messages'][-1]['content'].upper()
+        chunks = []
+        for part in (text[:2], text[2:]):
+            chunk = MagicMock(usage=None)
+            chunk.choices[0].delta.content = part
+            chunks.append(chunk)
+        # With include_usage, the last chunk has no choices and carries the usage
+        chunks.append(MagicMock(choices=[], usage=MagicMock(prompt_tokens=3, completion_tokens=5)))
+        return iter(chunks)
+
+    def test_translate_counts_usage(self):
+        """Tests that translation returns the streamed text and records token usage per call."""
+        self.translator.client.chat.completions.create.side_effect = self._echo_response
+
+        self.assertEqual([self.translator.translate(f'text {i}') for i in range(2)], ['TEXT 0', 'TEXT 1'])
+        self.assertEqual(self.translator.get_statistics(), {
+            'input_tokens': 6,
+            'output_tokens': 10,
+            'api_calls': 2
+        })
+
+    def test_deterministic_completions_are_cached(self):
+        """Tests that identical temperature-0 requests reach the API once and others always do."""
+        self.translator.client.chat.completions.create.side_effect = self._echo_response
+
+        for _ in range(2):
+            self.assertEqual(self.translator.call_openai('test-model', 'same text', temperature=0.0), 'SAME TEXT')
+        self.assertEqual(self.translator.client.chat.completions.create.call_count, 1)
+        self.assertEqual(self.translator.client.chat.completions.create.call_args.kwargs['temperature'], 0.0)
+        self.assertTrue(self.translator.client.chat.completions.create.call_args.kwargs['stream'])
+
+        for _ in range(2):
+            self.translator.call_openai('test-model', 'same text', temperature=0.7)
+        self.assertEqual(self.translator.client.chat.completions.create.call_count, 3)
+        self.assertEqual(self.translator.get_statistics()['api_calls'], 3)
+
+    def test_failed_requests_are_not_cached(self):
+        """Tests that an API error returns an empty string and the request is retried next time."""
+        self.translator.client.chat.completions.create.side_effect = [RuntimeError('boom'), self._echo_response(
+            messages=[{'role': 'user', 'content': 'retry'}]
+        )]
+
+        self.assertEqual(self.translator.call_openai('test-model', 'retry', temperature=0), '')
+        self.assertEqual(self.translator.call_openai('test-model', 'retry', temperature=0), 'RETRY')
+
+    def test_empty_completions_are_not_cached(self):
+        """Tests that a stream without content is reported as a failure and the retry reaches the API."""
+        self.translator.client.chat.completions.create.side_effect = [iter([]), self._echo_response(
+            messages=[{'role': 'user', 'content': 'retry'}]
+        )]
+
+        self.assertEqual(self.translator.call_openai('test-model', 'retry', temperature=0), '')
+        self.assertEqual(self.translator.call_openai('test-model', 'retry', temperature=0), 'RETRY')
+        self.assertEqual(self.translator.client.chat.completions.create.call_count, 2)
+
+    def test_refine_builds_prompt_from_precomputed_parts(self):
+        """Tests that refine sends the refine prompt, original and translation in the expected layout."""
+        self.translator.client.chat.completions.create.side_effect = self._echo_response
+
+        self.translator.refine('translated', 'original')
+        messages = self.translator.client.chat.completions.create.call_args.kwargs['messages']
+        self.assertEqual(messages, [
+            {'role': 'system', 'content': 'Be precise.'},
+            {'role': 'user', 'content': 'Improve this.\n\nOriginal text:\noriginal\n\nTranslated text to refine:\ntranslated'},
+        ])
+
+        self.translator.refine('translated')
+        messages = self.translator.client.chat.completions.create.call_args.kwargs['messages']
+        self.assertEqual(messages[-1]['content'], 'Improve this.\n\ntranslated')
+
+    def test_streaming_retries_without_stream_options_when_rejected(self):
+        """Tests that a backend rejecting stream_options is retried without it, and not asked again."""
+        rejected = Exception('Unrecognized request argument supplied: stream_options')
+        rejected.status_code = 400
+        create = self.translator.client.chat.completions.create
+        create.side_effect = [rejected, self._echo_response(messages=[{'role': 'user', 'content': 'one'}]),
+                              self._echo_response(messages=[{'role': 'user', 'content': 'two'}])]
+
+        self.assertEqual(self.translator.call_openai('test-model', 'one', temperature=0.5), 'ONE')
+        self.assertIn('stream_options', create.call_args_list[0].kwargs)
+        self.assertNotIn('stream_options', create.call_args_list[1].kwargs)
+        self.assertTrue(create.call_args_list[1].kwargs['stream'])
+
+        self.assertEqual(self.translator.call_openai('test-model', 'two', temperature=0.5), 'TWO')
+        self.assertEqual(create.call_count, 3)
+        self.assertNotIn('stream_options', create.call_args.kwargs)
+
+    def test_streaming_does_not_retry_other_errors(self):
+        """Tests that unrelated API errors are not retried without stream_options."""
+        unavailable = Exception('Service unavailable')
+        unavailable.status_code = 503
+        self.translator.client.chat.completions.create.side_effect = unavailable
+
+        self.assertEqual(self.translator.call_openai('test-model', 'text', temperature=0.5), '')
+        self.assertEqual(self.translator.client.chat.completions.create.call_count, 1)
+
+    def test_unrelated_bad_request_keeps_stream_usage(self):
+        """Tests that a 400 not about stream_options is not retried and keeps usage streaming on."""
+        too_long = Exception("This model's maximum context length is 8192 tokens")
+        too_long.status_code = 400
+        create = self.translator.client.chat.completions.create
+        create.side_effect = [too_long, self._echo_response(messages=[{'role': 'user', 'content': 'next'}])]
+
+        self.assertEqual(self.translator.call_openai('test-model', 'huge', temperature=0.5), '')
+        self.assertEqual(create.call_count, 1)
+        self.assertTrue(self.translator._stream_usage_supported)
+
+        self.assertEqual(self.translator.call_openai('test-model', 'next', temperature=0.5), 'NEXT')
+        self.assertIn('stream_options', create.call_args.kwargs)
+        self.assertEqual(self.translator.get_statistics()['input_tokens'], 3)
+
+    @patch('difflib.unified_diff')
+    def test_show_diff_skips_matcher_for_identical_texts(self, mock_unified_diff):
+        """Tests that identical translations are reported without running difflib."""
+        TextUtils.show_diff('same\ntext', 'same\ntext')
+        mock_unified_diff.assert_not_called()
+
+if __name__ == '__main__':
+    unittest.main()
